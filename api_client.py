@@ -0,0 +1,70 @@
+"""
+Client for the scraping backend (HF Space or local uvicorn app)
+
+Shared by the Streamlit page and the recurring crawl scheduler, which can
+also run as its own process (see scheduler.py).
+"""
+import json
+from typing import Dict, List
+
+# -----------------------------
+# HF API Client
+# -----------------------------
+class HFAPIClient:
+    def __init__(self, base_url: str):
+        # Deferred so pages that never reach the backend don't pay for importing requests
+        import requests
+        self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+
+    def health(self):
+        r = self.session.get(f"{self.base_url}/health", timeout=5)
+        r.raise_for_status()
+        return r.json()
+
+    def start_scrape(self, payload: Dict):
+        r = self.session.post(f"{self.base_url}/scrape", json=payload, timeout=10)
+        r.raise_for_status()
+        return r.json()
+
+    def job_status(self, job_id: str):
+        r = self.session.get(f"{self.base_url}/jobs/{job_id}", timeout=5)
+        r.raise_for_status()
+        return r.json()
+
+    def download(self, job_id: str, fmt: str):
+        r = self.session.get(f"{self.base_url}/download/{job_id}/{fmt}", timeout=30)
+        r.raise_for_status()
+        return r.content
+
+    def upload_sheets(self, payload: Dict):
+        r = self.session.post(
+            f"{self.base_url}/google-sheets/upload",
+            json=payload,
+            timeout=30
+        )
+        r.raise_for_status()
+        return r.json()
+    
+    def recommend(self, url: str, intent: str):
+        """Get AI-powered recommendation from master.py"""
+        r = self.session.post(
+            f"{self.base_url}/recommend",
+            json={"url": url, "intent": intent},
+            timeout=30
+        )
+        r.raise_for_status()
+        return r.json()
+
+# -----------------------------
+# Result Parsing
+# -----------------------------
+def extract_products(content: bytes) -> List[Dict]:
+    """Pull the product list out of a JSON export"""
+    data = json.loads(content)
+    if isinstance(data, dict):
+        data = data.get("products", data.get("items", []))
+    if not isinstance(data, list):
+        return []
+    return [p for p in data if isinstance(p, dict)]
@@ -0,0 +1,136 @@
+"""
+Startup benchmark for streamlit_app.py
+
+Measures, using Streamlit's headless AppTest runner:
+  - cold start: a fresh Python process importing Streamlit and running the page once
+  - steady-state rerun: repeated reruns of the page in an already-warm process
+
+Rerun times include AppTest's own bookkeeping, so compare them against earlier
+runs of this script rather than treating them as absolute numbers.
+
+The backend defaults to the "Local" option so no remote network calls are timed.
+
+Usage:
+    python bench_startup.py
+    python bench_startup.py --cold-runs 5 --reruns 50
+    python bench_startup.py --max-cold-ms 3000 --max-rerun-ms 150   # exit 1 on regression
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "streamlit_app.py")
+DEFAULT_BACKEND = "http://localhost:7860"
+
+
+def measure_in_process(backend_url: str, reruns: int) -> dict:
+    """Time Streamlit import, the first page run and `reruns` warm reruns"""
+    t0 = time.perf_counter()
+    import streamlit
+    from streamlit.testing.v1 import AppTest, app_test, local_script_runner
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    t_import = time.perf_counter()
+
+    # AppTest recompiles the page on every run, while the real server compiles it
+    # once per process and reuses the bytecode; share one cache so reruns match.
+    # These are private names, so refuse to run rather than silently time recompiles
+    for module in (app_test, local_script_runner):
+        if not hasattr(module, "ScriptCache"):
+            raise RuntimeError(
+                f"{module.__name__}.ScriptCache not found in Streamlit {streamlit.__version__}; "
+                "update the ScriptCache patch in bench_startup.py"
+            )
+    shared_cache = ScriptCache()
+    app_test.ScriptCache = lambda: shared_cache
+    local_script_runner.ScriptCache = lambda: shared_cache
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.session_state.backend_url = backend_url
+    at.run()
+    t_first = time.perf_counter()
+    if at.exception:
+        raise RuntimeError(f"App raised on first run: {at.exception[0].value}")
+
+    rerun_ms = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        rerun_ms.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "streamlit_version": streamlit.__version__,
+        "import_ms": (t_import - t0) * 1000,
+        "first_run_ms": (t_first - t_import) * 1000,
+        "cold_start_ms": (t_first - t0) * 1000,
+        "rerun_ms": rerun_ms,
+    }
+
+
+def run_child(backend_url: str, reruns: int, data_dir: str) -> dict:
+    """Run one measurement in a fresh interpreter so nothing is pre-imported"""
+    env = {**os.environ, "SCRAPER_DATA_DIR": data_dir}
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", "--backend-url", backend_url, "--reruns", str(reruns)],
+        capture_output=True, text=True, env=env
+    )
+    if out.returncode != 0:
+        # Surface the child's error (e.g. a missing ScriptCache) instead of a bare exit code
+        raise RuntimeError(f"Benchmark child failed:\n{out.stderr.strip()}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start and rerun time of the Streamlit page")
+    parser.add_argument("--cold-runs", type=int, default=3, help="Fresh processes to average cold start over")
+    parser.add_argument("--reruns", type=int, default=20, help="Warm reruns per process")
+    parser.add_argument("--backend-url", default=DEFAULT_BACKEND)
+    parser.add_argument("--max-cold-ms", type=float, help="Fail if median cold start exceeds this")
+    parser.add_argument("--max-rerun-ms", type=float, help="Fail if median rerun exceeds this")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_in_process(args.backend_url, args.reruns)))
+        return 0
+
+    # Keep benchmark runs away from real presets/schedules unless a data dir is given
+    with tempfile.TemporaryDirectory(prefix="bench_") as tmp_dir:
+        data_dir = os.environ.get("SCRAPER_DATA_DIR") or tmp_dir
+        samples = [run_child(args.backend_url, args.reruns, data_dir) for _ in range(args.cold_runs)]
+    reruns = [ms for s in samples for ms in s["rerun_ms"]]
+    results = {
+        "streamlit_version": samples[0]["streamlit_version"],
+        "import_ms": statistics.median(s["import_ms"] for s in samples),
+        "first_run_ms": statistics.median(s["first_run_ms"] for s in samples),
+        "cold_start_ms": statistics.median(s["cold_start_ms"] for s in samples),
+        "rerun_median_ms": statistics.median(reruns) if reruns else 0.0,
+        "rerun_p95_ms": sorted(reruns)[int(len(reruns) * 0.95)] if reruns else 0.0,
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"Streamlit {results['streamlit_version']}")
+        print(f"Cold start (median of {args.cold_runs}): {results['cold_start_ms']:.0f} ms")
+        print(f"  import streamlit:  {results['import_ms']:.0f} ms")
+        print(f"  first page run:    {results['first_run_ms']:.0f} ms")
+        print(f"Steady-state rerun ({len(reruns)} runs): median {results['rerun_median_ms']:.1f} ms, p95 {results['rerun_p95_ms']:.1f} ms")
+
+    failed = False
+    if args.max_cold_ms is not None and results["cold_start_ms"] > args.max_cold_ms:
+        print(f"FAIL: cold start {results['cold_start_ms']:.0f} ms > {args.max_cold_ms:.0f} ms")
+        failed = True
+    if args.max_rerun_ms is not None and results["rerun_median_ms"] > args.max_rerun_ms:
+        print(f"FAIL: rerun {results['rerun_median_ms']:.1f} ms > {args.max_rerun_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,402 @@
+"""
+Recurring crawl scheduler
+
+Stores recurring scrape definitions (the same payload the page sends to
+/scrape) under SCRAPER_DATA_DIR and runs them on a fixed interval, with a
+global (SCRAPER_MAX_CONCURRENT_JOBS) and a per-domain
+(SCRAPER_MAX_JOBS_PER_DOMAIN) concurrency limit.
+
+Only one scheduler per data directory runs jobs: whichever process holds the
+exclusive lock on scheduler.lock. The Streamlit page starts one on first load;
+to keep recurring jobs running across restarts without waiting for a page
+visit, run it as its own process next to the app:
+
+    python scheduler.py
+
+Incremental re-scrape contract
+------------------------------
+Every /scrape payload sent for a schedule carries
+
+    "known_urls": [
+        {"url": "https://...", "last_seen": "2026-10-19T11:00:00",
+         "etag": "...", "last_modified": "...", "content_hash": "..."},
+        ...
+    ]
+
+with one entry per product page URL the previous run returned. The etag,
+last_modified and content_hash fields are copied from products in the JSON
+export when the backend reports them. content_hash must be a hash the backend
+computes from the page content itself. The backend may skip a page when a
+conditional GET (If-None-Match / If-Modified-Since) returns 304 or its page
+hash still matches. It should list skipped pages in result["unchanged_urls"]
+so they stay known. A URL that a run neither returns nor reports as unchanged
+is dropped from the list.
+
+Because skipped pages are not scraped, a run's total_products only counts
+what was scraped that run. The catalogue size is tracked separately as
+known_products, the number of known product page URLs after the run.
+
+File locking uses fcntl, or msvcrt on Windows. Where neither exists, locks
+are no-ops, so run only one app/scheduler process per data directory.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from api_client import HFAPIClient, extract_products
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# Configuration
+# -----------------------------
+DATA_DIR = os.environ.get("SCRAPER_DATA_DIR", ".scraper_data")
+SCHEDULES_PATH = os.path.join(DATA_DIR, "schedules.json")
+SCHEDULE_RUNS_PATH = os.path.join(DATA_DIR, "schedule_runs.jsonl")
+SCHEDULES_LOCK_PATH = os.path.join(DATA_DIR, "schedules.lock")
+SCHEDULER_LOCK_PATH = os.path.join(DATA_DIR, "scheduler.lock")
+SCHEDULER_MAX_JOBS = int(os.environ.get("SCRAPER_MAX_CONCURRENT_JOBS", "4"))
+SCHEDULER_MAX_JOBS_PER_DOMAIN = int(os.environ.get("SCRAPER_MAX_JOBS_PER_DOMAIN", "1"))
+SCHEDULER_TICK_SECONDS = 30
+SCHEDULER_POLL_SECONDS = 5
+SCHEDULER_JOB_TIMEOUT = 2 * 60 * 60
+
+# Page validators the backend may report per product and check on the next run
+PAGE_VALIDATORS = ("etag", "last_modified", "content_hash")
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def get_domain(url: str) -> str:
+    netloc = urlparse(url).netloc.lower()
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+def product_page_url(product: Dict) -> Optional[str]:
+    url = product.get("url") or product.get("product_url")
+    if isinstance(url, str) and url.startswith(("http://", "https://")):
+        return url
+    return None
+
+def known_page_records(products: List[Dict], unchanged_urls: List[str], known: Dict, seen_at: str) -> Dict[str, Dict]:
+    """Known-URL map after a run: pages returned by the backend or reported unchanged"""
+    records = {}
+    for p in products:
+        url = product_page_url(p)
+        if url:
+            records[url] = {"last_seen": seen_at, **{k: p[k] for k in PAGE_VALIDATORS if p.get(k)}}
+    for url in unchanged_urls:
+        if url in known and url not in records:
+            records[url] = {**known[url], "last_seen": seen_at}
+    return records
+
+def page_changed(old: Dict, new: Dict) -> bool:
+    return any(k in old and k in new and old[k] != new[k] for k in PAGE_VALIDATORS)
+
+def lock_file(f, shared: bool = False, blocking: bool = True):
+    """Lock an open file across processes; raises OSError if non-blocking and taken"""
+    if fcntl is not None:
+        mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        fcntl.flock(f, mode if blocking else mode | fcntl.LOCK_NB)
+    elif msvcrt is not None:
+        # msvcrt has no shared locks; lock the first byte exclusively
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+
+def load_schedules() -> Dict:
+    """Parse schedules.json; a missing file is empty, a corrupt one is an error"""
+    try:
+        with open(SCHEDULES_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        logger.error("%s is not valid JSON; fix or remove it to resume scheduling", SCHEDULES_PATH)
+        raise
+
+# -----------------------------
+# Scheduler
+# -----------------------------
+class CrawlScheduler:
+    """Runs stored scrape payloads on a fixed interval in background threads.
+
+    At most SCHEDULER_MAX_JOBS jobs run at once, and at most
+    SCHEDULER_MAX_JOBS_PER_DOMAIN against any single domain; due jobs that
+    don't fit stay due until the next tick.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running: Dict[str, str] = {}  # schedule id -> domain
+        self._owner_lock_file = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether this instance owns the data directory and runs jobs"""
+        return self._thread is not None
+
+    def start(self) -> bool:
+        """Start running jobs unless another scheduler already owns DATA_DIR"""
+        if self.active:
+            return True
+        os.makedirs(DATA_DIR, exist_ok=True)
+        owner_file = open(SCHEDULER_LOCK_PATH, "w")
+        try:
+            lock_file(owner_file, blocking=False)
+        except OSError:
+            owner_file.close()
+            return False
+
+        # Claims left by a previous owner died with its process
+        try:
+            with self._store() as schedules:
+                for schedule in schedules.values():
+                    schedule["running"] = False
+        except Exception:
+            owner_file.close()
+            raise
+        self._owner_lock_file = owner_file
+
+        self._thread = threading.Thread(target=self._loop, name="crawl-scheduler", daemon=True)
+        self._thread.start()
+        logger.info("Crawl scheduler started for %s", DATA_DIR)
+        return True
+
+    # Storage ------------------------------------------------------------
+    @contextmanager
+    def _store(self):
+        """Read-modify-write schedules.json, locked across threads and processes"""
+        with self._lock:
+            os.makedirs(DATA_DIR, exist_ok=True)
+            with open(SCHEDULES_LOCK_PATH, "w") as f_lock:
+                lock_file(f_lock)
+                schedules = load_schedules()
+                yield schedules
+                tmp_path = f"{SCHEDULES_PATH}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(schedules, f, indent=2)
+                os.replace(tmp_path, SCHEDULES_PATH)
+
+    def _update(self, schedule_id: str, **fields):
+        with self._store() as schedules:
+            if schedule_id in schedules:
+                schedules[schedule_id].update(fields)
+
+    def _record_run(self, run: Dict):
+        with self._lock:
+            os.makedirs(DATA_DIR, exist_ok=True)
+            with open(SCHEDULE_RUNS_PATH, "ab") as f:
+                # Start on a fresh line if a previous append was cut off
+                if f.tell() and not self._ends_with_newline():
+                    f.write(b"\n")
+                f.write((json.dumps(run) + "\n").encode("utf-8"))
+
+    @staticmethod
+    def _ends_with_newline() -> bool:
+        with open(SCHEDULE_RUNS_PATH, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    # Public API ---------------------------------------------------------
+    def add(self, backend_url: str, payload: Dict, interval_hours: float) -> str:
+        schedule_id = uuid.uuid4().hex[:8]
+        with self._store() as schedules:
+            schedules[schedule_id] = {
+                "id": schedule_id,
+                "domain": get_domain(payload["url"]),
+                "backend_url": backend_url,
+                "payload": payload,
+                "interval_hours": interval_hours,
+                "next_run": time.time(),
+                "running": False,
+                "last_run_at": None,
+                "last_status": None,
+                "last_error": None,
+                "known_urls": {}
+            }
+        if self.active:
+            self._tick()
+        return schedule_id
+
+    def remove(self, schedule_id: str):
+        with self._store() as schedules:
+            schedules.pop(schedule_id, None)
+
+    def schedules(self) -> List[Dict]:
+        # Read-only: shared lock, nothing written back
+        with self._lock:
+            os.makedirs(DATA_DIR, exist_ok=True)
+            with open(SCHEDULES_LOCK_PATH, "a") as f_lock:
+                lock_file(f_lock, shared=True)
+                schedules = load_schedules()
+        return sorted(schedules.values(), key=lambda sc: sc["next_run"])
+
+    def runs(self, limit: int = 200) -> List[Dict]:
+        with self._lock:
+            try:
+                with open(SCHEDULE_RUNS_PATH, "r", encoding="utf-8") as f:
+                    lines = f.readlines()[-limit:]
+            except FileNotFoundError:
+                return []
+        runs = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                runs.append(json.loads(line))
+            except ValueError:
+                # e.g. a partial line from a process killed mid-append
+                logger.warning("Skipping unreadable line in %s: %r", SCHEDULE_RUNS_PATH, line[:80])
+        return runs
+
+    # Execution ----------------------------------------------------------
+    def _loop(self):
+        while True:
+            try:
+                self._tick()
+            except Exception:
+                logger.exception("Scheduler tick failed")
+            time.sleep(SCHEDULER_TICK_SECONDS)
+
+    def _tick(self):
+        now = time.time()
+        claimed = []
+        with self._store() as schedules:
+            for schedule in sorted(schedules.values(), key=lambda sc: sc["next_run"]):
+                if schedule["next_run"] > now or schedule.get("running"):
+                    continue
+                if len(self._running) >= SCHEDULER_MAX_JOBS:
+                    break
+                domain_jobs = sum(1 for d in self._running.values() if d == schedule["domain"])
+                if domain_jobs >= SCHEDULER_MAX_JOBS_PER_DOMAIN:
+                    continue
+                # Claim the run before starting it so no later tick can start it again
+                schedule["running"] = True
+                schedule["next_run"] = now + schedule["interval_hours"] * 3600
+                self._running[schedule["id"]] = schedule["domain"]
+                claimed.append(dict(schedule))
+        for schedule in claimed:
+            threading.Thread(target=self._run, args=(schedule,), daemon=True).start()
+
+    def _run(self, schedule: Dict):
+        started = time.time()
+        started_at = datetime.fromtimestamp(started).isoformat(timespec="seconds")
+        known = schedule.get("known_urls", {})
+        payload = {
+            **schedule["payload"],
+            # Page URLs plus validators from the last run (see module docstring)
+            "known_urls": [{"url": url, **record} for url, record in known.items()]
+        }
+        run = {
+            "schedule_id": schedule["id"],
+            "domain": schedule["domain"],
+            "started_at": started_at,
+            "job_id": None,
+            "status": "failed",
+            "total_products": 0,
+            "pages_crawled": 0,
+            "new_products": 0,
+            "changed_products": 0,
+            "known_products": None,
+            "error": None
+        }
+        known_urls = known
+        try:
+            api = HFAPIClient(schedule["backend_url"])
+            job_id = api.start_scrape(payload).get("job_id")
+            if not job_id:
+                raise RuntimeError("No job ID returned")
+            run["job_id"] = job_id
+
+            while True:
+                job = api.job_status(job_id)
+                if job.get("status") in ("completed", "failed"):
+                    break
+                if time.time() - started > SCHEDULER_JOB_TIMEOUT:
+                    raise TimeoutError("Job polling timeout")
+                time.sleep(SCHEDULER_POLL_SECONDS)
+
+            run["status"] = job.get("status")
+            result = job.get("result") or {}
+            run["total_products"] = result.get("total_products", 0) or 0
+            run["pages_crawled"] = result.get("pages_crawled", 0) or 0
+
+            if run["status"] == "completed":
+                try:
+                    if "json" not in result.get("files", {}):
+                        raise RuntimeError("Job produced no JSON export")
+                    products = extract_products(api.download(job_id, "json"))
+                except Exception as e:
+                    # The backend finished, but there is nothing to track this run against
+                    run["status"] = "completed_no_results"
+                    raise RuntimeError(f"Failed to load results: {e}") from e
+                known_urls = known_page_records(products, result.get("unchanged_urls", []), known, started_at)
+                run["known_products"] = len(known_urls)
+                run["new_products"] = sum(1 for url in known_urls if url not in known)
+                run["changed_products"] = sum(
+                    1 for url, record in known_urls.items()
+                    if url in known and page_changed(known[url], record)
+                )
+        except Exception as e:
+            run["error"] = str(e)
+            logger.warning("Scheduled crawl %s (%s) failed: %s", schedule["id"], schedule["domain"], e)
+        finally:
+            finished = time.time()
+            run["finished_at"] = datetime.fromtimestamp(finished).isoformat(timespec="seconds")
+            run["duration_s"] = round(finished - started, 1)
+            self._record_run(run)
+            self._update(
+                schedule["id"],
+                running=False,
+                last_run_at=started_at,
+                last_status=run["status"],
+                last_error=run["error"],
+                known_urls=known_urls
+            )
+            with self._lock:
+                self._running.pop(schedule["id"], None)
+
+# -----------------------------
+# Process-wide Instance
+# -----------------------------
+_scheduler: Optional[CrawlScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> CrawlScheduler:
+    """The process-wide scheduler; survives Streamlit reruns and cache clears.
+
+    If another process owns the data directory, this instance only manages
+    definitions, and each call retries taking over in case that process exited.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = CrawlScheduler()
+        try:
+            _scheduler.start()
+        except ValueError:
+            pass  # Corrupt schedules.json, already logged; stays inactive until fixed
+        return _scheduler
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    if not get_scheduler().active:
+        raise SystemExit(f"Scheduler not started for {DATA_DIR}: another process owns it, or schedules.json is unreadable")
+    while True:
+        time.sleep(3600)
@@ -1,9 +1,35 @@
 import streamlit as st
+import os
 import time
-from typing import Dict
-import requests
+import math
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product as iter_product
+from urllib.request import urlopen
 import json
 from datetime import datetime
+from ui_assets import (
+    HEADER_HTML,
+    EMPTY_STATE_ICON_HTML,
+    EMPTY_STATE_TEXT_HTML,
+    EMPTY_STATE_LINK_HTML,
+    BACKEND_OPTIONS,
+    CRAWLER_OPTIONS,
+    CRAWLER_DESCRIPTIONS,
+    SCRAPER_OPTIONS,
+    SCRAPER_DESCRIPTIONS,
+    STRICTNESS_OPTIONS,
+    STRICTNESS_DESCRIPTIONS,
+    STATUS_EMOJI,
+    FORMAT_META,
+    default_intent_for,
+    intent_needed
+)
+from api_client import HFAPIClient, extract_products
+from scheduler import DATA_DIR, get_domain, get_scheduler
+
+# `requests` is the only heavy import (json/datetime/urllib are already loaded by
+# Streamlit itself), so HFAPIClient only imports it once a job talks to the backend.
 
 # -----------------------------
 # Streamlit Page Config
@@ -17,29 +43,7 @@ st.set_page_config(
 # -----------------------------
 # Header
 # -----------------------------
-st.markdown("""
-<div class="header-container">
-    <div class="header-title">
-        <div class="header-text">
-            <h1>Product Catalog Scraper</h1>
-            <p>AI-powered data extraction</p>
-        </div>
-    </div>
-    <div class="backend-status">
-        <span class="status-dot" style="background-color: #28a745;"></span>
-        Backend Online
-    </div>
-</div>
-""", unsafe_allow_html=True)
-
-# -----------------------------
-# Backend Configuration Options
-# -----------------------------
-BACKEND_OPTIONS = {
-    "Local": "http://localhost:7860",
-    "LAM Sales": "https://gouriikarus3d-lam-sales.hf.space",
-    # "Product Catalogue AI": "https://gouriikarus3d-product-catalogue-ai.hf.space"
-}
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 # -----------------------------
 # Backend Feature Detection
@@ -47,13 +51,32 @@ BACKEND_OPTIONS = {
 @st.cache_data(ttl=60)
 def get_backend_features(api_base: str):
     try:
-        r = requests.get(f"{api_base}/features", timeout=5)
-        if r.status_code == 200:
-            return {"available": True, **r.json()}
+        with urlopen(f"{api_base}/features", timeout=5) as r:
+            if r.status == 200:
+                return {"available": True, **json.load(r)}
     except:
         pass
     return {"available": False, "google_sheets": {"enabled": False}}
 
+# -----------------------------
+# Domain Presets
+# -----------------------------
+PRESETS_PATH = os.path.join(DATA_DIR, "presets.json")
+
+def load_presets() -> Dict:
+    try:
+        with open(PRESETS_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_preset(domain: str, preset: Dict):
+    presets = load_presets()
+    presets[domain] = {**preset, "saved_at": datetime.now().isoformat(timespec="seconds")}
+    os.makedirs(DATA_DIR, exist_ok=True)
+    with open(PRESETS_PATH, "w", encoding="utf-8") as f:
+        json.dump(presets, f, indent=2)
+
 # -----------------------------
 # Initialize Session State
 # -----------------------------
@@ -69,6 +92,14 @@ if 'poll_count' not in st.session_state:
     st.session_state.poll_count = 0
 if 'backend_url' not in st.session_state:
     st.session_state.backend_url = BACKEND_OPTIONS["LAM Sales"]
+if 'benchmark_jobs' not in st.session_state:
+    st.session_state.benchmark_jobs = []
+if 'benchmark_poll_count' not in st.session_state:
+    st.session_state.benchmark_poll_count = 0
+if 'benchmark_preset_saved' not in st.session_state:
+    st.session_state.benchmark_preset_saved = False
+if 'benchmark_max_in_flight' not in st.session_state:
+    st.session_state.benchmark_max_in_flight = 4
 
 # -----------------------------
 # Sidebar – Scraper Settings
@@ -144,55 +175,31 @@ with st.sidebar:
 
         st.markdown('<div class="sidebar-section-header" style="margin-top: 1.5rem;">🔍 Crawler Selection</div>', unsafe_allow_html=True)
         
-        crawler_options = {
-            "Web Crawler": "web",
-            "AI Crawler (Legacy)": "ai",
-            "Unified Crawler (Recommended)": "unified"
-        }
-        
         crawler_display = st.radio(
             "Crawler Type",
-            options=list(crawler_options.keys()),
+            options=list(CRAWLER_OPTIONS.keys()),
             index=2,  # Default to Unified
             label_visibility="collapsed",
             help="Web: Traditional crawling with classification\nAI: Legacy Gemini-powered crawler\nUnified: Discover + AI filter (recommended)"
         )
-        crawler = crawler_options[crawler_display]
+        crawler = CRAWLER_OPTIONS[crawler_display]
         
         # Crawler descriptions
-        crawler_descriptions = {
-            "Web Crawler": "🌐 Traditional: Crawls pages and classifies using rule-based signals (fast, reliable for standard sites)",
-            "AI Crawler (Legacy)": "🤖 Legacy AI: Uses Jina + Gemini for page classification (requires Jina API)",
-            "Unified Crawler (Recommended)": "✨ Best Choice: Discovers all URLs then uses Gemini to filter by intent (no Jina required, more reliable)"
-        }
-        st.info(crawler_descriptions[crawler_display])
+        st.info(CRAWLER_DESCRIPTIONS[crawler_display])
         
         st.markdown('<div class="sidebar-section-header" style="margin-top: 1.5rem;">⚙️ Scraper Selection</div>', unsafe_allow_html=True)
         
-        scraper_options = {
-            "Static (HTML Parsing)": "static",
-            "LAM (Gemini + Playwright)": "lam",
-            "AI (AI Extraction)": "ai",
-            "Auto (Intelligent Routing)": "auto"
-        }
-        
         scraper_display = st.radio(
             "Scraper Type",
-            options=list(scraper_options.keys()),
+            options=list(SCRAPER_OPTIONS.keys()),
             index=0,  # Default to Static
             label_visibility="collapsed",
             help="Static: Fast HTML parsing\nLAM: Gemini-guided interactive extraction for configurators\nAI: AI-powered semantic extraction\nAuto: Intelligent routing based on content type"
         )
-        scraper = scraper_options[scraper_display]
+        scraper = SCRAPER_OPTIONS[scraper_display]
         
         # Scraper descriptions
-        scraper_descriptions = {
-            "Static (HTML Parsing)": "⚡ Fast: Extracts data from HTML using Jina AI (works on most sites)",
-            "LAM (Gemini + Playwright)": "🎯 Interactive: Uses Gemini + Playwright to navigate configurators and extract variants",
-            "AI (AI Extraction)": "🧠 Semantic: AI-powered extraction with deep content understanding",
-            "Auto (Intelligent Routing)": "🤖 Smart: Analyzes each URL and routes to optimal scraper (LAM/Static/AI) automatically"
-        }
-        st.info(scraper_descriptions[scraper_display])
+        st.info(SCRAPER_DESCRIPTIONS[scraper_display])
         
         # Force AI option (only for LAM scraper)
         force_ai = False
@@ -225,14 +232,7 @@ with st.sidebar:
             st.markdown(f'<div class="sidebar-section-header" style="margin-top: 1.5rem;">{intent_label}</div>', unsafe_allow_html=True)
             
             # Default intent based on combination
-            if crawler in ["ai", "unified"]:
-                default_intent = "Extract custom projects with pricing information. Include case studies and service offerings."
-            elif scraper == "auto":
-                default_intent = "Extract all products with customization options and prices. Route configurators to LAM, standard pages to Static, and vague content to AI."
-            elif scraper == "lam":
-                default_intent = "Extract all products with customization options and prices. Ignore blogs and marketing pages."
-            else:
-                default_intent = "Extract products with detailed specifications and pricing."
+            default_intent = default_intent_for(crawler, scraper)
             
             user_intent = st.text_area(
                 "User Intent",
@@ -256,28 +256,17 @@ with st.sidebar:
 
         st.markdown('<div class="sidebar-section-header" style="margin-top: 1.5rem;">🎯 Scraping Strictness</div>', unsafe_allow_html=True)
         
-        strictness_options = {
-            "Lenient": "lenient",
-            "Balanced": "balanced",
-            "Strict": "strict"
-        }
-        
         strictness_display = st.radio(
             "Strictness Level",
-            options=list(strictness_options.keys()),
+            options=list(STRICTNESS_OPTIONS.keys()),
             index=1,
             label_visibility="collapsed",
             help="Lenient: Captures more products, may include noise\nBalanced: Optimal balance of coverage and accuracy\nStrict: High precision, may miss some products"
         )
-        strictness = strictness_options[strictness_display]
+        strictness = STRICTNESS_OPTIONS[strictness_display]
         
         # Description based on selection
-        strictness_descriptions = {
-            "Lenient": "Captures more products, may include some noise",
-            "Balanced": "Optimal balance of coverage and accuracy",
-            "Strict": "High precision, may miss some products"
-        }
-        st.caption(strictness_descriptions[strictness_display])
+        st.caption(STRICTNESS_DESCRIPTIONS[strictness_display])
 
         st.markdown('<div class="sidebar-section-header" style="margin-top: 1.5rem;">📊 Crawling Controls</div>', unsafe_allow_html=True)
         
@@ -285,6 +274,52 @@ with st.sidebar:
         max_depth = st.slider("Max Depth", 1, 5, 3)
         delay = st.slider("Delay", 0.1, 5.0, 0.5, 0.1, format="%.1fs")
 
+        use_preset = st.checkbox(
+            "Use Saved Domain Preset",
+            value=False,
+            help="Apply the crawler/scraper/strictness that won the last benchmark for this domain (if any)"
+        )
+
+        st.markdown('<div class="sidebar-section-header" style="margin-top: 1.5rem;">🏁 Benchmark Mode</div>', unsafe_allow_html=True)
+        benchmark_mode = st.checkbox(
+            "Race Configurations",
+            value=False,
+            help="Run every selected crawler × scraper × strictness combination against the URL and compare them"
+        )
+        with st.expander("Benchmark Matrix", expanded=False):
+            bench_crawlers = st.multiselect(
+                "Crawlers",
+                options=list(CRAWLER_OPTIONS.keys()),
+                default=["Web Crawler", "Unified Crawler (Recommended)"]
+            )
+            bench_scrapers = st.multiselect(
+                "Scrapers",
+                options=list(SCRAPER_OPTIONS.keys()),
+                default=["Static (HTML Parsing)", "Auto (Intelligent Routing)"]
+            )
+            bench_strictness = st.multiselect(
+                "Strictness Levels",
+                options=list(STRICTNESS_OPTIONS.keys()),
+                default=["Balanced"]
+            )
+            bench_max_pages = st.slider("Max Pages per Configuration", 5, 50, 10, 5)
+            bench_workers = st.slider(
+                "Max Jobs In Flight",
+                1, 8, 4,
+                help="How many configurations run on the backend at once; the rest wait and are submitted as earlier ones finish"
+            )
+            st.caption("Each configuration uses its own default intent (none if it doesn't need one). If you edit the Extraction Intent text, your text is used for all of them.")
+            bench_count = len(bench_crawlers) * len(bench_scrapers) * len(bench_strictness)
+            st.caption(f"{bench_count} configuration(s) per benchmark run")
+
+        st.markdown('<div class="sidebar-section-header" style="margin-top: 1.5rem;">🗓️ Recurring Schedule</div>', unsafe_allow_html=True)
+        schedule_job = st.checkbox(
+            "Save as Recurring Job",
+            value=False,
+            help="Store this configuration and re-scrape it automatically; unchanged pages are skipped on later runs"
+        )
+        schedule_hours = st.number_input("Run Every (hours)", min_value=1, max_value=720, value=24, step=1)
+
         st.markdown('<div class="sidebar-section-header" style="margin-top: 1.5rem;">📄 Export Format</div>', unsafe_allow_html=True)
         st.caption("JSON export is enabled by default")
 
@@ -311,52 +346,117 @@ with st.sidebar:
         )
 
 # -----------------------------
-# HF API Client
+# Benchmark Helpers
 # -----------------------------
-class HFAPIClient:
-    def __init__(self, base_url: str):
-        self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
-
-    def health(self):
-        r = self.session.get(f"{self.base_url}/health", timeout=5)
-        r.raise_for_status()
-        return r.json()
-
-    def start_scrape(self, payload: Dict):
-        r = self.session.post(f"{self.base_url}/scrape", json=payload, timeout=10)
-        r.raise_for_status()
-        return r.json()
-
-    def job_status(self, job_id: str):
-        r = self.session.get(f"{self.base_url}/jobs/{job_id}", timeout=5)
-        r.raise_for_status()
-        return r.json()
-
-    def download(self, job_id: str, fmt: str):
-        r = self.session.get(f"{self.base_url}/download/{job_id}/{fmt}", timeout=30)
-        r.raise_for_status()
-        return r.content
-
-    def upload_sheets(self, payload: Dict):
-        r = self.session.post(
-            f"{self.base_url}/google-sheets/upload",
-            json=payload,
-            timeout=30
-        )
-        r.raise_for_status()
-        return r.json()
-    
-    def recommend(self, url: str, intent: str):
-        """Get AI-powered recommendation from master.py"""
-        r = self.session.post(
-            f"{self.base_url}/recommend",
-            json={"url": url, "intent": intent},
-            timeout=30
-        )
-        r.raise_for_status()
-        return r.json()
+def submit_benchmark_job(base_url: str, job: Dict) -> Dict:
+    """Submit one queued benchmark configuration; runs inside a worker thread"""
+    entry = {**job, "status": "pending", "submitted_at": time.time()}
+    try:
+        # One client per thread - requests.Session is not thread-safe
+        job = HFAPIClient(base_url).start_scrape(entry["payload"])
+        entry["job_id"] = job.get("job_id")
+        if not entry["job_id"]:
+            entry["error"] = "No job ID returned"
+    except Exception as e:
+        entry["error"] = str(e)
+    if not entry["job_id"]:
+        entry["status"] = "failed"
+        entry["finished_at"] = time.time()
+    return entry
+
+def submit_queued_benchmark_jobs(base_url: str, jobs: List[Dict], max_in_flight: int):
+    """Submit queued configurations while fewer than max_in_flight are running"""
+    in_flight = sum(1 for job in jobs if job["status"] not in ("queued", "completed", "failed"))
+    queued = [i for i, job in enumerate(jobs) if job["status"] == "queued"]
+    batch = queued[:max(max_in_flight - in_flight, 0)]
+    if not batch:
+        return
+    with ThreadPoolExecutor(max_workers=len(batch)) as pool:
+        submitted = list(pool.map(lambda i: submit_benchmark_job(base_url, jobs[i]), batch))
+    for i, job in zip(batch, submitted):
+        jobs[i] = job
+
+def product_key(product: Dict) -> str:
+    """Identity used to match the same product across configurations"""
+    key = product.get("url") or product.get("product_url") or product.get("name")
+    if not key:
+        key = json.dumps(product, sort_keys=True)
+    return str(key).strip().lower()
+
+def parse_duration(value) -> Optional[float]:
+    """Seconds from a backend duration like 12.3, "12.3s" or "0:01:05" """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        return None
+    text = value.strip().lower().rstrip("s").strip()
+    try:
+        seconds = 0.0
+        for part in text.split(":"):
+            seconds = seconds * 60 + float(part)
+        return seconds
+    except ValueError:
+        return None
+
+def benchmark_wall_time(job: Dict) -> Optional[float]:
+    """Backend-reported duration when available; client time is only accurate to a poll interval"""
+    if job["submitted_at"] is None:
+        return None
+    backend_duration = parse_duration((job.get("result") or {}).get("duration"))
+    if backend_duration is not None:
+        return backend_duration
+    return (job["finished_at"] or time.time()) - job["submitted_at"]
+
+def summarize_benchmark(jobs: List[Dict]) -> List[Dict]:
+    rows = []
+    for job in jobs:
+        result = job.get("result") or {}
+        wall_time = benchmark_wall_time(job)
+        pages = result.get("pages_crawled", 0) or 0
+        products = result.get("total_products", 0) or 0
+        cost = result.get("cost_usd", result.get("cost"))
+        rows.append({
+            "Configuration": job["label"],
+            "Status": job["status"],
+            "Wall Time (s)": round(wall_time, 1) if wall_time is not None else None,
+            "Pages/s": round(pages / wall_time, 2) if wall_time else 0.0,
+            "Products": products,
+            "Cost/Product": f"${cost / products:.4f}" if isinstance(cost, (int, float)) and products else "N/A"
+        })
+    return rows
+
+def benchmark_overlap(jobs: List[Dict]) -> List[Dict]:
+    """Pairwise product overlap (shared / combined unique products)"""
+    key_sets = {
+        job["label"]: set(job.get("product_keys", []))
+        for job in jobs if job["status"] == "completed"
+    }
+    rows = []
+    for label_a, keys_a in key_sets.items():
+        row = {"Configuration": label_a}
+        for label_b, keys_b in key_sets.items():
+            union = keys_a | keys_b
+            row[label_b] = f"{len(keys_a & keys_b) / len(union):.0%}" if union else "-"
+        rows.append(row)
+    return rows
+
+def pick_benchmark_winner(jobs: List[Dict]) -> Optional[Dict]:
+    """Most products wins; ties go to the faster configuration"""
+    completed = [
+        job for job in jobs
+        if job["status"] == "completed" and ((job.get("result") or {}).get("total_products", 0) or 0) > 0
+    ]
+    if not completed:
+        return None
+    return max(
+        completed,
+        key=lambda job: ((job.get("result") or {}).get("total_products", 0) or 0, -benchmark_wall_time(job))
+    )
+
+# -----------------------------
+# Recurring Crawl Scheduler
+# -----------------------------
+scheduler = get_scheduler()
 
 # -----------------------------
 # Main Content Area
@@ -373,34 +473,71 @@ if not st.session_state.scraping_started:
         # Icon and title
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            st.markdown("""
-            <div style='text-align: center;'>
-                <div style='width: 80px; height: 80px; background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%); 
-                     border-radius: 20px; display: inline-flex; align-items: center; justify-content: center; 
-                     color: white; font-size: 40px; margin-bottom: 1.5rem;'>
-                    ✨
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(EMPTY_STATE_ICON_HTML, unsafe_allow_html=True)
             
             st.markdown("# Ready to Extract Products")
-            st.markdown("""
-            <p style='color: #6b7280; font-size: 1rem; line-height: 1.5;'>
-                Configure your scraping parameters in the sidebar and click "Start Scraping" 
-                to extract structured product data from any e-commerce website.
-            </p>
-            """, unsafe_allow_html=True)
+            st.markdown(EMPTY_STATE_TEXT_HTML, unsafe_allow_html=True)
             
-            st.markdown("""
-            <p style='margin-top: 1rem;'>
-                <a href='#' style='color: #3b82f6; text-decoration: none; font-weight: 500;'>
-                    ← Configure settings to get started
-                </a>
-            </p>
-            """, unsafe_allow_html=True)
+            st.markdown(EMPTY_STATE_LINK_HTML, unsafe_allow_html=True)
         
         st.markdown("</div>", unsafe_allow_html=True)
 
+# -----------------------------
+# Scheduled Crawls
+# -----------------------------
+if not st.session_state.scraping_started:
+    try:
+        schedules = scheduler.schedules()
+    except ValueError:
+        schedules = []
+        st.error(f"❌ {os.path.join(DATA_DIR, 'schedules.json')} is corrupted - fix or remove it to resume scheduled crawls")
+    if schedules:
+        st.markdown("### 🗓️ Scheduled Crawls")
+        if not scheduler.active:
+            st.caption(f"Jobs are run by another scheduler process for `{DATA_DIR}`")
+        for sc in schedules:
+            col_info, col_button = st.columns([4, 1])
+            with col_info:
+                sc_payload = sc["payload"]
+                st.markdown(f"**{sc['domain']}** • every {sc['interval_hours']}h • {sc_payload['crawler']} / {sc_payload['scraper']} / {sc_payload['strictness']}")
+                if sc.get("running"):
+                    st.caption("🔄 Running now")
+                else:
+                    next_run = datetime.fromtimestamp(sc["next_run"]).strftime("%Y-%m-%d %H:%M")
+                    st.caption(f"Next run {next_run} • last status: {sc['last_status'] or 'never run'} • {len(sc.get('known_urls', {}))} known pages")
+                if sc.get("last_error"):
+                    st.caption(f"⚠️ Last run failed: {sc['last_error']}")
+            with col_button:
+                if st.button("🗑️ Remove", key=f"remove_schedule_{sc['id']}", use_container_width=True):
+                    scheduler.remove(sc["id"])
+                    st.rerun()
+
+        runs = scheduler.runs()
+        if runs:
+            st.markdown("#### Run History")
+            # Catalogue size, not products scraped: unchanged pages the backend skips aren't scraped
+            completed_runs = [r for r in runs if r["status"] == "completed" and r.get("known_products") is not None]
+            if completed_runs:
+                st.line_chart(completed_runs, x="finished_at", y="known_products", color="domain")
+            st.dataframe(
+                [
+                    {
+                        "Domain": r["domain"],
+                        "Finished": r["finished_at"],
+                        "Status": r["status"],
+                        "Duration (s)": r["duration_s"],
+                        "Catalogue": r.get("known_products"),
+                        "Scraped": r["total_products"],
+                        "New": r["new_products"],
+                        "Changed": r["changed_products"],
+                        "Pages": r["pages_crawled"]
+                    }
+                    for r in reversed(runs)
+                ],
+                use_container_width=True,
+                hide_index=True
+            )
+
 # -----------------------------
 # Run Scraper
 # -----------------------------
@@ -413,6 +550,14 @@ if run_button:
         st.error("⚠️ Please select at least one export format")
         st.stop()
 
+    if benchmark_mode and schedule_job:
+        st.error("⚠️ Benchmark mode can't be saved as a recurring job - run the benchmark first, then schedule its preset")
+        st.stop()
+
+    if benchmark_mode and not bench_count:
+        st.error("⚠️ Select at least one crawler, scraper and strictness level to benchmark")
+        st.stop()
+
     # Clear the empty state and mark scraping as started
     st.session_state.scraping_started = True
     main_content.empty()
@@ -425,9 +570,31 @@ if run_button:
         except Exception as e:
             st.error(f"❌ Backend unavailable: {str(e)}")
             st.stop()
+
+    # The intent text area is pre-filled, so only treat edited text as the user's own intent
+    intent_customized = bool(user_intent) and user_intent.strip() != default_intent_for(crawler, scraper)
+
+    # Apply saved domain preset (winner of a previous benchmark)
+    domain = get_domain(url)
+    preset = load_presets().get(domain) if use_preset and not benchmark_mode else None
+    if preset:
+        crawler = preset.get("crawler", crawler)
+        if preset.get("scraper", scraper) != scraper:
+            scraper = preset["scraper"]
+            force_ai = False  # Force AI only applies to the LAM scraper chosen in the sidebar
+        strictness = preset.get("strictness", strictness)
+        if not intent_customized:
+            # Replay the intent the preset was benchmarked with
+            if preset.get("intent"):
+                user_intent = preset["intent"]
+            elif intent_needed(crawler, scraper):
+                user_intent = default_intent_for(crawler, scraper)
+            else:
+                user_intent = None
+        st.info(f"📌 Using saved preset for {domain}: {crawler} crawler + {scraper} scraper ({strictness})")
     
-    # Step 0: Get AI Recommendation (if enabled)
-    if get_recommendation and recommend_intent:
+    # Step 0: Get AI Recommendation (if enabled; benchmark mode races its own matrix)
+    if get_recommendation and recommend_intent and not benchmark_mode:
         st.info("🧠 Getting AI-powered recommendation from Master Flow Recommender...")
         
         try:
@@ -502,6 +669,64 @@ if run_button:
         "google_sheets_id": sheets_id
     }
 
+    if schedule_job:
+        st.session_state.scraping_started = False
+        try:
+            scheduler.add(st.session_state.backend_url, payload, schedule_hours)
+        except ValueError:
+            st.error(f"❌ {os.path.join(DATA_DIR, 'schedules.json')} is corrupted - fix or remove it before adding schedules")
+            st.stop()
+        st.success(f"🗓️ Scheduled {get_domain(url)} every {schedule_hours}h - the first run starts now")
+        st.stop()
+
+    if benchmark_mode:
+        bench_jobs = []
+        for c, s, x in iter_product(bench_crawlers, bench_scrapers, bench_strictness):
+            config = {
+                "crawler": CRAWLER_OPTIONS[c],
+                "scraper": SCRAPER_OPTIONS[s],
+                "strictness": STRICTNESS_OPTIONS[x]
+            }
+            # Same intent rules as a normal run: none unless the combination uses one
+            if intent_customized:
+                config["intent"] = user_intent
+            elif intent_needed(config["crawler"], config["scraper"]):
+                config["intent"] = default_intent_for(config["crawler"], config["scraper"])
+            else:
+                config["intent"] = None
+            bench_jobs.append({
+                **config,
+                "label": f"{config['crawler']} / {config['scraper']} / {config['strictness']}",
+                "payload": {
+                    **payload,
+                    **config,
+                    "force_ai": False,
+                    "max_pages": min(max_pages, bench_max_pages),
+                    "google_sheets_upload": False
+                },
+                "job_id": None,
+                "status": "queued",
+                "submitted_at": None,
+                "finished_at": None,
+                "result": {},
+                "product_keys": [],
+                "error": None
+            })
+
+        st.info(f"🏁 Submitting up to {bench_workers} of {len(bench_jobs)} benchmark jobs...")
+        # Worker threads have no script context, so resolve session state up front
+        submit_queued_benchmark_jobs(st.session_state.backend_url, bench_jobs, bench_workers)
+
+        st.session_state.job_id = None
+        st.session_state.benchmark_jobs = bench_jobs
+        st.session_state.benchmark_max_in_flight = bench_workers
+        st.session_state.benchmark_url = url
+        st.session_state.benchmark_poll_count = 0
+        st.session_state.benchmark_preset_saved = False
+        st.rerun()
+
+    st.session_state.benchmark_jobs = []
+
     st.info("🚀 Submitting scraping job...")
     job = api.start_scrape(payload)
     job_id = job.get("job_id")
@@ -571,13 +796,7 @@ if st.session_state.scraping_started and st.session_state.job_id:
             st.session_state.progress_pct = 0
         
         # Display job status
-        status_emoji = {
-            "pending": "⏳",
-            "running": "🔄",
-            "exporting": "📦",
-            "completed": "✅",
-            "failed": "❌"
-        }.get(status, "🔄")
+        status_emoji = STATUS_EMOJI.get(status, "🔄")
         
         status_display = status.replace("_", " ").title()
         
@@ -660,16 +879,9 @@ if st.session_state.scraping_started and st.session_state.job_id:
                 st.markdown("<div style='margin-bottom: 1rem;'></div>", unsafe_allow_html=True)
 
             # Download Files
-            format_meta = {
-                "json": ("application/json", ".json", "📄", "JSON Export"),
-                "csv": ("text/csv", ".csv", "📊", "CSV Export"),
-                "csv_prices": ("text/csv", "_with_prices.csv", "💰", "Prices CSV"),
-                "quotation": ("application/json", "_quotation.json", "📋", "Quotation")
-            }
-
             for fmt in files:
-                if fmt in format_meta:
-                    mime, ext, icon, label = format_meta[fmt]
+                if fmt in FORMAT_META:
+                    mime, ext, icon, label = FORMAT_META[fmt]
                     
                     try:
                         content = api.download(st.session_state.job_id, fmt)
@@ -715,4 +927,88 @@ if st.session_state.scraping_started and st.session_state.job_id:
                 
     except Exception as e:
         st.error(f"❌ Error polling job status: {str(e)}")
-        st.session_state.scraping_started = False
\ No newline at end of file
+        st.session_state.scraping_started = False
+
+# -----------------------------
+# Benchmark Polling (Non-blocking)
+# -----------------------------
+if st.session_state.scraping_started and st.session_state.benchmark_jobs:
+    api = HFAPIClient(st.session_state.backend_url)
+    bench_jobs = st.session_state.benchmark_jobs
+    st.session_state.benchmark_poll_count += 1
+
+    # Record finish times first so result downloads don't inflate other jobs' wall time
+    newly_completed = []
+    for job in bench_jobs:
+        if job["status"] in ("queued", "completed", "failed"):
+            continue
+        try:
+            job_info = api.job_status(job["job_id"])
+        except Exception as e:
+            job["error"] = str(e)
+            continue
+        job["status"] = job_info.get("status", job["status"])
+        if job["status"] in ("completed", "failed"):
+            job["finished_at"] = time.time()
+            job["result"] = job_info.get("result") or {}
+            if job["status"] == "completed":
+                newly_completed.append(job)
+
+    for job in newly_completed:
+        if "json" not in job["result"].get("files", {}):
+            continue
+        try:
+            products = extract_products(api.download(job["job_id"], "json"))
+            job["product_keys"] = sorted({product_key(p) for p in products})
+        except Exception as e:
+            job["error"] = f"Failed to download results: {str(e)}"
+
+    # Fill the slots that just freed up
+    submit_queued_benchmark_jobs(st.session_state.backend_url, bench_jobs, st.session_state.benchmark_max_in_flight)
+
+    done = sum(1 for job in bench_jobs if job["status"] in ("completed", "failed"))
+    bench_domain = get_domain(st.session_state.benchmark_url)
+
+    st.markdown(f"### 🏁 Benchmark: {bench_domain}")
+    st.markdown(f"**Progress: {done}/{len(bench_jobs)} configurations finished**")
+    st.progress(int(done / len(bench_jobs) * 100))
+    st.dataframe(summarize_benchmark(bench_jobs), use_container_width=True, hide_index=True)
+
+    for job in bench_jobs:
+        if job["error"]:
+            st.caption(f"⚠️ {job['label']}: {job['error']}")
+
+    if done == len(bench_jobs):
+        st.markdown("### 🔀 Product Overlap")
+        st.caption("Share of combined unique products found by both configurations")
+        overlap = benchmark_overlap(bench_jobs)
+        if overlap:
+            st.dataframe(overlap, use_container_width=True, hide_index=True)
+
+        winner = pick_benchmark_winner(bench_jobs)
+        if winner:
+            winner_result = winner.get("result") or {}
+            winner_time = benchmark_wall_time(winner)
+            st.success(f"🏆 Winner: {winner['label']} ({winner_result.get('total_products', 0)} products in {winner_time:.1f}s)")
+            if not st.session_state.benchmark_preset_saved:
+                try:
+                    save_preset(bench_domain, {
+                        "crawler": winner["crawler"],
+                        "scraper": winner["scraper"],
+                        "strictness": winner["strictness"],
+                        "intent": winner["intent"],
+                        "products": winner_result.get("total_products", 0),
+                        "wall_time_s": round(winner_time, 1)
+                    })
+                    st.session_state.benchmark_preset_saved = True
+                except OSError as e:
+                    st.warning(f"⚠️ Could not save preset: {str(e)}")
+            if st.session_state.benchmark_preset_saved:
+                st.caption(f"📌 Saved as the preset for {bench_domain}")
+        else:
+            st.error("❌ No winner: no configuration found any products, so no preset was saved.")
+    elif st.session_state.benchmark_poll_count < 300 * math.ceil(len(bench_jobs) / st.session_state.benchmark_max_in_flight):
+        time.sleep(2)
+        st.rerun()
+    else:
+        st.error("⏱️ Benchmark polling timeout. Some jobs may still be running on the backend.")
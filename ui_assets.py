@@ -0,0 +1,142 @@
+"""
+Static UI assets and option tables for streamlit_app.py
+
+Streamlit re-executes the page script on every interaction, but imported
+modules are only executed once per process, so everything that never
+changes between reruns lives here.
+"""
+
+# -----------------------------
+# Header
+# -----------------------------
+HEADER_HTML = """
+<div class="header-container">
+    <div class="header-title">
+        <div class="header-text">
+            <h1>Product Catalog Scraper</h1>
+            <p>AI-powered data extraction</p>
+        </div>
+    </div>
+    <div class="backend-status">
+        <span class="status-dot" style="background-color: #28a745;"></span>
+        Backend Online
+    </div>
+</div>
+"""
+
+# -----------------------------
+# Empty State
+# -----------------------------
+EMPTY_STATE_ICON_HTML = """
+<div style='text-align: center;'>
+    <div style='width: 80px; height: 80px; background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
+         border-radius: 20px; display: inline-flex; align-items: center; justify-content: center;
+         color: white; font-size: 40px; margin-bottom: 1.5rem;'>
+        ✨
+    </div>
+</div>
+"""
+
+EMPTY_STATE_TEXT_HTML = """
+<p style='color: #6b7280; font-size: 1rem; line-height: 1.5;'>
+    Configure your scraping parameters in the sidebar and click "Start Scraping"
+    to extract structured product data from any e-commerce website.
+</p>
+"""
+
+EMPTY_STATE_LINK_HTML = """
+<p style='margin-top: 1rem;'>
+    <a href='#' style='color: #3b82f6; text-decoration: none; font-weight: 500;'>
+        ← Configure settings to get started
+    </a>
+</p>
+"""
+
+# -----------------------------
+# Backend Configuration Options
+# -----------------------------
+BACKEND_OPTIONS = {
+    "Local": "http://localhost:7860",
+    "LAM Sales": "https://gouriikarus3d-lam-sales.hf.space",
+    # "Product Catalogue AI": "https://gouriikarus3d-product-catalogue-ai.hf.space"
+}
+
+# -----------------------------
+# Crawler / Scraper / Strictness Options
+# -----------------------------
+CRAWLER_OPTIONS = {
+    "Web Crawler": "web",
+    "AI Crawler (Legacy)": "ai",
+    "Unified Crawler (Recommended)": "unified"
+}
+
+CRAWLER_DESCRIPTIONS = {
+    "Web Crawler": "🌐 Traditional: Crawls pages and classifies using rule-based signals (fast, reliable for standard sites)",
+    "AI Crawler (Legacy)": "🤖 Legacy AI: Uses Jina + Gemini for page classification (requires Jina API)",
+    "Unified Crawler (Recommended)": "✨ Best Choice: Discovers all URLs then uses Gemini to filter by intent (no Jina required, more reliable)"
+}
+
+SCRAPER_OPTIONS = {
+    "Static (HTML Parsing)": "static",
+    "LAM (Gemini + Playwright)": "lam",
+    "AI (AI Extraction)": "ai",
+    "Auto (Intelligent Routing)": "auto"
+}
+
+SCRAPER_DESCRIPTIONS = {
+    "Static (HTML Parsing)": "⚡ Fast: Extracts data from HTML using Jina AI (works on most sites)",
+    "LAM (Gemini + Playwright)": "🎯 Interactive: Uses Gemini + Playwright to navigate configurators and extract variants",
+    "AI (AI Extraction)": "🧠 Semantic: AI-powered extraction with deep content understanding",
+    "Auto (Intelligent Routing)": "🤖 Smart: Analyzes each URL and routes to optimal scraper (LAM/Static/AI) automatically"
+}
+
+STRICTNESS_OPTIONS = {
+    "Lenient": "lenient",
+    "Balanced": "balanced",
+    "Strict": "strict"
+}
+
+STRICTNESS_DESCRIPTIONS = {
+    "Lenient": "Captures more products, may include some noise",
+    "Balanced": "Optimal balance of coverage and accuracy",
+    "Strict": "High precision, may miss some products"
+}
+
+# -----------------------------
+# Default Intent
+# -----------------------------
+DEFAULT_INTENTS = {
+    "ai_crawler": "Extract custom projects with pricing information. Include case studies and service offerings.",
+    "auto": "Extract all products with customization options and prices. Route configurators to LAM, standard pages to Static, and vague content to AI.",
+    "lam": "Extract all products with customization options and prices. Ignore blogs and marketing pages.",
+    "default": "Extract products with detailed specifications and pricing."
+}
+
+def intent_needed(crawler: str, scraper: str) -> bool:
+    """Whether the combination requires or recommends an extraction intent"""
+    return crawler in ["ai", "unified"] or scraper in ["auto", "lam", "ai"]
+
+def default_intent_for(crawler: str, scraper: str) -> str:
+    """Return the default extraction intent for a crawler/scraper combination"""
+    if crawler in ["ai", "unified"]:
+        return DEFAULT_INTENTS["ai_crawler"]
+    return DEFAULT_INTENTS.get(scraper, DEFAULT_INTENTS["default"])
+
+# -----------------------------
+# Job Status / Downloads
+# -----------------------------
+STATUS_EMOJI = {
+    "queued": "🕒",
+    "pending": "⏳",
+    "running": "🔄",
+    "exporting": "📦",
+    "completed": "✅",
+    "failed": "❌"
+}
+
+FORMAT_META = {
+    "json": ("application/json", ".json", "📄", "JSON Export"),
+    "csv": ("text/csv", ".csv", "📊", "CSV Export"),
+    "csv_prices": ("text/csv", "_with_prices.csv", "💰", "Prices CSV"),
+    "quotation": ("application/json", "_quotation.json", "📋", "Quotation")
+}